@@ -3,7 +3,7 @@ import threading
 import time
 
 # Ensure Django settings are configured for pytest
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'science_repo.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'science_repo.test_settings')
 
 import django
 
@@ -6,6 +6,9 @@ import sys
 
 def main():
     """Run administrative tasks."""
+    # The test runner gets the test settings (in-memory SQLite) unless told otherwise
+    if sys.argv[1:2] == ['test']:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'science_repo.test_settings')
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'science_repo.settings')
     try:
         from django.core.management import execute_from_command_line
@@ -4,7 +4,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db.models import Q, Prefetch
 from django.utils import timezone
 from django.conf import settings
 from django.http import Http404
@@ -123,6 +123,21 @@ class PublicationViewSet(viewsets.ModelViewSet):
             return PublicationListSerializer
         return PublicationSerializer
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'current_version' and self.request.user.is_authenticated:
+            # The access checks walk every version's authors and status_user,
+            # so load them together with the publication instead of per version
+            queryset = queryset.select_related('editorial_board').prefetch_related(
+                Prefetch(
+                    'document_versions',
+                    queryset=DocumentVersion.objects.select_related('status_user').prefetch_related(
+                        Prefetch('authors', queryset=Author.objects.select_related('user'))
+                    )
+                )
+            )
+        return queryset
+
     def perform_create(self, serializer):
         # First save the publication to get an ID
         publication = serializer.save(editorial_board=self.request.user)
@@ -221,10 +236,12 @@ class PublicationViewSet(viewsets.ModelViewSet):
             # Check if the user is the creator of the publication itself
             # First try to get the user from the latest version's authors
             is_publication_creator = False
-            latest_version = publication.latest_version()
+            # Versions are prefetched newest first (see get_queryset)
+            all_versions = list(publication.document_versions.all())
+            latest_version = all_versions[0] if all_versions else None
             if latest_version:
                 # Check if the user is an author of the latest version
-                if latest_version.authors.filter(user=request.user).exists():
+                if any(author.user_id == request.user.id for author in latest_version.authors.all()):
                     is_publication_creator = True
                     logger.info(f"User is an author of the latest version")
 
@@ -241,14 +258,13 @@ class PublicationViewSet(viewsets.ModelViewSet):
             logger.info(f"User is publication creator: {is_publication_creator}")
 
             # Check all versions to see if the user is an author or creator of any of them
-            all_versions = list(publication.document_versions.all())
             logger.info(f"Publication has {len(all_versions)} versions")
 
             for version in all_versions:
                 logger.info(f"Checking version {version.id}, status: {version.status}")
 
                 # Check if the user is an author of this version
-                author_exists = version.authors.filter(user=request.user).exists()
+                author_exists = any(author.user_id == request.user.id for author in version.authors.all())
                 if author_exists:
                     is_author = True
                     logger.info(f"User is author of version {version.id}")
@@ -267,7 +283,7 @@ class PublicationViewSet(viewsets.ModelViewSet):
                 authors = list(version.authors.all())
                 logger.info(f"Version {version.id} has {len(authors)} authors")
                 for author in authors:
-                    logger.info(f"Author: {author.name}, user_id: {author.user_id if author.user else 'None'}")
+                    logger.info(f"Author: {author.name}, user_id: {author.user_id}")
 
                 # If the user is either an author or a creator, we can break the loop
                 if is_author or is_creator:
@@ -278,7 +294,7 @@ class PublicationViewSet(viewsets.ModelViewSet):
             if is_author or is_creator or is_publication_creator or is_editorial_board or is_staff_or_superuser:
                 logger.info(f"User has access. is_author: {is_author}, is_creator: {is_creator}, is_publication_creator: {is_publication_creator}, is_editorial_board: {is_editorial_board}, is_staff_or_superuser: {is_staff_or_superuser}")
                 # First try to get the latest version
-                version = publication.latest_version()
+                version = latest_version
                 if version:
                     logger.info(f"Returning latest version: {version.id}, status: {version.status}")
                     serializer = DocumentVersionSerializer(version)
@@ -312,73 +328,17 @@ class PublicationViewSet(viewsets.ModelViewSet):
             logger.info("User is not authenticated")
 
         # For non-authenticated users or users who are not authors or editorial board members,
-        # return only the published version
-        version = publication.current_version()
+        # return only the published version. The access checks above already
+        # loaded every version newest first, so pick it from those.
+        if request.user.is_authenticated:
+            version = next((v for v in all_versions if v.status == 'published'), None)
+        else:
+            version = publication.current_version()
         if version:
             logger.info(f"Returning published version: {version.id}")
             serializer = DocumentVersionSerializer(version)
             return Response(serializer.data)
 
-        # If no published version found, check if there are any versions at all
-        all_versions = list(publication.document_versions.filter(status='published'))
-        if all_versions:
-            # Get the version with the highest version number
-            version = sorted(all_versions, key=lambda v: v.version_number, reverse=True)[0]
-            logger.info(f"Found published version directly: {version.id}, status: {version.status}")
-            serializer = DocumentVersionSerializer(version)
-            return Response(serializer.data)
-
-        # Check if the user is an author, creator, editorial office member, or staff/superuser
-        if request.user.is_authenticated:
-            # Check if the user is a staff member or superuser
-            is_staff_or_superuser = request.user.is_staff or request.user.is_superuser
-
-            # Check if the user is the editorial board member
-            is_editorial_board = (publication.editorial_board == request.user)
-
-            # Check if the user is an author or creator of any version
-            is_author = False
-            is_creator = False
-            all_versions = list(publication.document_versions.all())
-
-            for version in all_versions:
-                # Check if the user is an author of this version
-                if version.authors.filter(user=request.user).exists():
-                    is_author = True
-                    break
-
-                # Check if the user is the creator of this version
-                if version.status_user == request.user:
-                    is_creator = True
-                    break
-
-            # If the user has special access, return the full publication data
-            if is_author or is_creator or is_editorial_board or is_staff_or_superuser:
-                logger.info(f"User has special access in second check. is_author: {is_author}, is_creator: {is_creator}, is_editorial_board: {is_editorial_board}, is_staff_or_superuser: {is_staff_or_superuser}")
-
-                # First try to get the latest version
-                latest_version = publication.latest_version()
-                if latest_version:
-                    logger.info(f"User has special access, returning latest version: {latest_version.id}")
-                    serializer = DocumentVersionSerializer(latest_version)
-                    return Response(serializer.data)
-
-                # If no latest version found, check if there are any versions at all
-                all_versions = list(publication.document_versions.all())
-                if all_versions:
-                    # Get the version with the highest version number
-                    version = sorted(all_versions, key=lambda v: v.version_number, reverse=True)[0]
-                    logger.info(f"User has special access, found version directly: {version.id}, status: {version.status}")
-                    serializer = DocumentVersionSerializer(version)
-                    return Response(serializer.data)
-
-                # If no versions at all, return the full publication data
-                logger.info("No versions found at all, but user has special access in second check")
-                # Create a serializer for the publication
-                pub_serializer = PublicationSerializer(publication)
-                # Return the full publication data
-                return Response(pub_serializer.data)
-
         logger.info("No published version found")
         from core.exceptions import format_error_response
         return format_error_response('No published version found.', status.HTTP_404_NOT_FOUND)
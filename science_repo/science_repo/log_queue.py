@@ -0,0 +1,58 @@
+import logging
+import logging.handlers
+import queue
+
+
+class QueueFileHandler(logging.handlers.QueueHandler):
+    """
+    Log handler that hands records to a background thread which writes them
+    to a file, so the calling (request) thread never blocks on disk I/O.
+
+    dictConfig on Python < 3.12 cannot set up a QueueListener, so this handler
+    owns the FileHandler it feeds and the listener is started separately via
+    start_queue_listeners() (see CoreConfig.ready()). Records logged before
+    that wait in the queue. When the queue is full, new records are dropped
+    instead of blocking the caller.
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False, maxsize=10000):
+        # Created first so that logging.shutdown(), which closes handlers
+        # newest first, drains the queue before closing the file
+        self.file_handler = logging.FileHandler(filename, mode=mode, encoding=encoding, delay=delay)
+        super().__init__(queue.Queue(maxsize=maxsize))
+        self.listener = logging.handlers.QueueListener(self.queue, self.file_handler, respect_handler_level=True)
+        self._listening = False
+
+    def setFormatter(self, fmt):
+        # Formatting happens on the listener thread; the queued record only
+        # needs its message merged, which QueueHandler.prepare() does
+        self.file_handler.setFormatter(fmt)
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+    def start(self):
+        if not self._listening:
+            self.listener.start()
+            self._listening = True
+
+    def stop(self):
+        """Write out everything still queued and stop the listener thread"""
+        if self._listening:
+            self.listener.stop()
+            self._listening = False
+
+    def close(self):
+        self.stop()
+        self.file_handler.close()
+        super().close()
+
+
+def start_queue_listeners(logger=None):
+    """Start the listener of every QueueFileHandler attached to ``logger`` (the root logger by default)"""
+    for handler in (logger or logging.getLogger()).handlers:
+        if isinstance(handler, QueueFileHandler):
+            handler.start()
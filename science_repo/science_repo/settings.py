@@ -320,8 +320,9 @@ LOGGING = {
     },
     'handlers': {
         'file': {
+            # Written from a background thread, see science_repo/log_queue.py
             'level': 'DEBUG',
-            'class': 'logging.FileHandler',
+            'class': 'science_repo.log_queue.QueueFileHandler',
             'filename': os.path.join(BASE_DIR, 'logs', 'django.log'),
             'formatter': 'verbose',
         },
@@ -0,0 +1,97 @@
+"""
+Django settings used when running the test suite.
+
+Extends the regular settings but does not rely on sniffing ``sys.argv`` for
+"pytest"/"test", which does not work inside pytest-xdist workers or
+``manage.py test --parallel`` child processes.
+
+Usage:
+    pytest                      (configured in pytest.ini)
+    python manage.py test --parallel=auto --keepdb   (manage.py picks these settings for "test")
+
+Set TEST_DISABLE_MIGRATIONS=1 to build the test schema straight from the
+models instead of replaying migrations (see MIGRATION_MODULES below).
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import BASE_DIR, REST_FRAMEWORK
+from decouple import config
+import os
+
+# SQLite for tests. TEST['NAME'] is intentionally left unset so that the test
+# runner builds the test database in memory, and each parallel worker gets its
+# own in-memory clone (Django suffixes them per worker).
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'test_db.sqlite3'),
+    }
+}
+
+# Same values settings.py applies when it detects a test run
+FORCE_SCRIPT_NAME = None
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_PERMISSION_CLASSES': (
+        'rest_framework.permissions.AllowAny',
+    ),
+    # APIClient encodes request bodies as JSON unless a test asks for multipart
+    'TEST_REQUEST_DEFAULT_FORMAT': 'json',
+}
+
+# The suite talks to the API through the test client only, so skip the
+# middleware that only matters to browsers (security headers, CORS, CSRF,
+# framing, CSP). Sessions stay for the ORCID OAuth state checks, messages
+# because the admin system check (run by manage.py test) requires it.
+# Production settings are not affected.
+MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+]
+
+# Let view exceptions reach the test instead of rendering the debug 500 page
+DEBUG_PROPAGATE_EXCEPTIONS = True
+
+# Every create_user()/login would otherwise run the full PBKDF2 iteration
+# count. A test that checks hashing itself can override this again.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Tests should not append to logs/django.log or print the DEBUG/INFO records
+# views emit on every request (current_version logs a dozen lines per call).
+# Warnings and errors still reach the console.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'level': 'WARNING',
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        '': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+        },
+    },
+}
+
+
+class DisableMigrations:
+    """Report every app as having no migrations module, so tables are created from the models"""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+# Opt-in only: the data migrations seed the default groups and comment types
+# that several tests rely on. Same effect as pytest-django's --nomigrations.
+if config('TEST_DISABLE_MIGRATIONS', default=False, cast=bool):
+    MIGRATION_MODULES = DisableMigrations()
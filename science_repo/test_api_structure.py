@@ -1,22 +1,6 @@
-import importlib
-import inspect
+import os
 from django.urls import URLPattern, URLResolver
 from django.urls.resolvers import RoutePattern, RegexPattern
-from django.core.management import call_command
-import os
-import sys
-import django
-
-# Set up Django environment
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'science_repo.settings')
-django.setup()
-
-# Import URL modules
-from science_repo.urls import urlpatterns as main_urlpatterns
-from core.urls import urlpatterns as core_urlpatterns
-from publications.urls import urlpatterns as publications_urlpatterns
-from comments.urls import urlpatterns as comments_urlpatterns
-from ai_assistant.urls import urlpatterns as ai_urlpatterns
 
 def get_pattern_name(pattern):
     """Extract the name from a URL pattern"""
@@ -66,6 +50,13 @@ def check_url_patterns(patterns, prefix=''):
     return results
 
 def main():
+    # Imported here because the URL modules need Django to be set up first
+    from science_repo.urls import urlpatterns as main_urlpatterns
+    from core.urls import urlpatterns as core_urlpatterns
+    from publications.urls import urlpatterns as publications_urlpatterns
+    from comments.urls import urlpatterns as comments_urlpatterns
+    from ai_assistant.urls import urlpatterns as ai_urlpatterns
+
     print("Checking API structure...")
 
     # Check main URL patterns
@@ -119,4 +110,8 @@ def main():
     print("API structure check completed.")
 
 if __name__ == "__main__":
+    # Only when run as a script; test runners set Django up themselves
+    import django
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'science_repo.settings')
+    django.setup()
     main()
@@ -1,3 +1,4 @@
+from django.db import transaction
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
@@ -5,7 +6,6 @@ from rest_framework import status
 from django.contrib.auth import get_user_model
 from publications.models import Publication, DocumentVersion, Author
 from comments.models import CommentType, Comment
-import json
 
 User = get_user_model()
 
@@ -74,36 +74,30 @@ class CommentCreationTest(TestCase):
             'doi_requested': False
         }
 
-        response = self.client.post(self.comments_url, comment_data, format='json')
-        print(f"Response status: {response.status_code}")
-        print(f"Response content: {response.content.decode()}")
-
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.post(self.comments_url, comment_data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, msg=response.content)
         self.assertEqual(Comment.objects.count(), 1)
 
         comment = Comment.objects.first()
         self.assertEqual(comment.comment_type.code, 'ER')
 
-        # Clean up
-        Comment.objects.all().delete()
-
     def test_create_comment_with_various_string_types(self):
         """Test creating comments with various string representations of comment types"""
         # Create all comment types if they don't exist
-        for code, name in [
-            ('SC', 'Scientific Comment'),
-            ('rSC', 'Response to Scientific Comment'),
-            ('AD', 'Additional Data'),
-            ('NP', 'New Publication')
-        ]:
-            CommentType.objects.get_or_create(
+        CommentType.objects.bulk_create([
+            CommentType(
                 code=code,
-                defaults={
-                    'name': name,
-                    'description': f'Description for {name}',
-                    'requires_doi': code != 'ER'
-                }
+                name=name,
+                description=f'Description for {name}',
+                requires_doi=code != 'ER'
             )
+            for code, name in [
+                ('SC', 'Scientific Comment'),
+                ('rSC', 'Response to Scientific Comment'),
+                ('AD', 'Additional Data'),
+                ('NP', 'New Publication')
+            ]
+        ], ignore_conflicts=True)
 
         # Test various string representations
         test_cases = [
@@ -120,24 +114,29 @@ class CommentCreationTest(TestCase):
             ('NEW', 'NP'),
         ]
 
-        for input_type, expected_code in test_cases:
-            comment_data = {
-                'document_version': self.version.id,
-                'content': f'Test comment with type {input_type}?',
-                'comment_type': input_type,
-                'line_number': 5,
-                'doi_requested': False
-            }
-
-            response = self.client.post(self.comments_url, comment_data, format='json')
-            print(f"Testing {input_type} -> {expected_code}")
-            print(f"Response status: {response.status_code}")
-            print(f"Response content: {response.content.decode()}")
-
-            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-
-            comment = Comment.objects.latest('id')
-            self.assertEqual(comment.comment_type.code, expected_code)
+        created = []
+        with transaction.atomic():
+            for input_type, expected_code in test_cases:
+                with self.subTest(input_type=input_type, expected_code=expected_code):
+                    comment_data = {
+                        'document_version': self.version.id,
+                        'content': f'Test comment with type {input_type}?',
+                        'comment_type': input_type,
+                        'line_number': 5,
+                        'doi_requested': False
+                    }
+
+                    response = self.client.post(self.comments_url, comment_data)
+                    self.assertEqual(response.status_code, status.HTTP_201_CREATED, msg=response.content)
+                    created.append((response.data['id'], input_type, expected_code))
+
+        # Fetch all created comments at once and check the resolved types
+        comments = Comment.objects.select_related('comment_type').in_bulk(
+            [comment_id for comment_id, _, _ in created]
+        )
+        for comment_id, input_type, expected_code in created:
+            with self.subTest(input_type=input_type, expected_code=expected_code):
+                self.assertEqual(comments[comment_id].comment_type.code, expected_code)
 
         # Verify total count
         self.assertEqual(Comment.objects.count(), len(test_cases))
@@ -1,10 +1,7 @@
-from django.test import TestCase
-from django.urls import reverse
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient, APITestCase
+from rest_framework.test import APITestCase
 from rest_framework import status
 from publications.models import Publication, DocumentVersion, Author
-import json
 
 User = get_user_model()
 
@@ -12,7 +9,6 @@ class DocumentVersionAuthorTest(APITestCase):
     """Test that the creator of a document version is properly associated with it as an author"""
 
     def setUp(self):
-        self.client = APIClient()
         self.publications_url = '/api/publications/publications/'
         self.document_versions_url = '/api/publications/document-versions/'
 
@@ -37,7 +33,7 @@ class DocumentVersionAuthorTest(APITestCase):
             'title': 'Test Publication',
             'short_title': 'Test Pub'
         }
-        response = self.client.post(self.publications_url, publication_data, format='json')
+        response = self.client.post(self.publications_url, publication_data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Get the publication ID
@@ -55,7 +51,7 @@ class DocumentVersionAuthorTest(APITestCase):
             'author_contributions': 'Test author contributions',
             'references': 'Test references'
         }
-        response = self.client.post(self.document_versions_url, document_version_data, format='json')
+        response = self.client.post(self.document_versions_url, document_version_data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Get the document version ID
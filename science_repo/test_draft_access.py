@@ -0,0 +1,74 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from publications.models import Publication, Author
+from tests.factories import make_draft_version, make_user
+
+class DraftAccessTest(APITestCase):
+    """Test who can view the draft returned by current_version"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.publications_url = '/api/publications/publications/'
+
+        # Editorial office member, document creator, author and an unrelated user
+        cls.editorial_user = make_user('editorial')
+        cls.creator_user = make_user('creator')
+        cls.author_user = make_user('author')
+        cls.regular_user = make_user('regular')
+
+        # Create a publication with editorial_board set to editorial_user
+        cls.publication = Publication.objects.create(
+            title='Test Publication',
+            short_title='Test Pub',
+            editorial_board=cls.editorial_user
+        )
+        cls.current_version_url = f'{cls.publications_url}{cls.publication.id}/current_version/'
+
+        # The creator is the status_user but not an author, so each role is checked on its own
+        cls.draft_version = make_draft_version(cls.publication, cls.creator_user)
+
+        Author.objects.create(
+            document_version=cls.draft_version,
+            user=cls.author_user,
+            name='Author User',
+            email='author@example.com',
+            institution='Test Institution',
+            is_corresponding=True
+        )
+
+    def assertSeesDraft(self, user):
+        self.client.force_authenticate(user=user)
+        # Publication, versions and authors, plus the serializer's nested relations
+        with self.assertNumQueries(8):
+            response = self.client.get(self.current_version_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'draft')
+
+    def test_author_sees_draft(self):
+        """Test that an author can view a draft even if they're not the creator"""
+        self.assertSeesDraft(self.author_user)
+
+    def test_creator_sees_draft(self):
+        """Test that the creator can view a draft even if they're not an author"""
+        self.assertSeesDraft(self.creator_user)
+
+    def test_editorial_sees_draft(self):
+        """Test that editorial office members can view draft documents"""
+        self.assertSeesDraft(self.editorial_user)
+
+    def test_regular_blocked(self):
+        """Test that regular users cannot view draft documents"""
+        self.client.force_authenticate(user=self.regular_user)
+        # Publication, versions and authors; the published-version fallback reuses them
+        with self.assertNumQueries(3):
+            response = self.client.get(self.current_version_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['error'], 'No published version found.')
+
+    def test_anonymous_blocked(self):
+        """Test that anonymous users cannot view draft documents"""
+        # Publication and its latest published version
+        with self.assertNumQueries(2):
+            response = self.client.get(self.current_version_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['error'], 'No published version found.')
@@ -38,7 +38,7 @@ class EditDraftDocumentTest(APITestCase):
             'title': 'Test Publication',
             'short_title': 'Test Pub'
         }
-        response = self.client.post(self.publications_url, publication_data, format='json')
+        response = self.client.post(self.publications_url, publication_data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Get the publication ID
@@ -56,7 +56,7 @@ class EditDraftDocumentTest(APITestCase):
             'author_contributions': 'Test author contributions',
             'references': 'Test references'
         }
-        response = self.client.post(self.document_versions_url, document_version_data, format='json')
+        response = self.client.post(self.document_versions_url, document_version_data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Get the document version ID
@@ -67,7 +67,7 @@ class EditDraftDocumentTest(APITestCase):
             'technical_abstract': 'Updated abstract',
             'main_text': 'Updated main text'
         }
-        response = self.client.patch(f"{self.document_versions_url}{document_version_id}/", edit_data, format='json')
+        response = self.client.patch(f"{self.document_versions_url}{document_version_id}/", edit_data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Check that the document version was updated
@@ -0,0 +1,59 @@
+import logging
+import os
+import tempfile
+from django.test import SimpleTestCase
+from science_repo.log_queue import QueueFileHandler
+
+class QueueFileHandlerTest(SimpleTestCase):
+    """Test that the queued file handler writes records from its listener thread"""
+
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix='.log')
+        os.close(fd)
+        self.addCleanup(os.remove, self.filename)
+
+        self.logger = logging.getLogger(f'{__name__}.{self._testMethodName}')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+
+    def make_handler(self, **kwargs):
+        handler = QueueFileHandler(self.filename, **kwargs)
+        handler.setFormatter(logging.Formatter('{levelname} {message}', style='{'))
+        self.logger.addHandler(handler)
+        self.addCleanup(handler.close)
+        self.addCleanup(self.logger.removeHandler, handler)
+        return handler
+
+    def read_log(self):
+        with open(self.filename) as f:
+            return f.read()
+
+    def test_records_are_written_once_stopped(self):
+        """Test that queued records, including tracebacks, end up in the file"""
+        handler = self.make_handler()
+        handler.start()
+
+        self.logger.info('hello %s', 'world')
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            self.logger.exception('failed')
+        handler.stop()
+
+        content = self.read_log()
+        self.assertIn('INFO hello world', content)
+        self.assertIn('ERROR failed', content)
+        self.assertIn('ValueError: boom', content)
+
+    def test_full_queue_drops_records(self):
+        """Test that logging does not block or raise once the queue is full"""
+        handler = self.make_handler(maxsize=1)
+
+        self.logger.info('kept')
+        self.logger.info('dropped')
+        handler.start()
+        handler.stop()
+
+        content = self.read_log()
+        self.assertIn('kept', content)
+        self.assertNotIn('dropped', content)
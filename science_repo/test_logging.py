@@ -1,19 +1,27 @@
 import os
-import django
 import logging
+import logging.config
 
-# Set up Django environment
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'science_repo.settings')
-django.setup()
+def main():
+    # Only the LOGGING setting is needed, so apply it directly instead of
+    # running django.setup() and loading every installed app
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'science_repo.settings')
+    from django.conf import settings
+    from science_repo.log_queue import start_queue_listeners
+    logging.config.dictConfig(settings.LOGGING)
+    start_queue_listeners()
 
-# Get a logger
-logger = logging.getLogger(__name__)
+    # Get a logger
+    logger = logging.getLogger(__name__)
 
-# Write some test log entries
-logger.debug('This is a debug message')
-logger.info('This is an info message')
-logger.warning('This is a warning message')
-logger.error('This is an error message')
-logger.critical('This is a critical message')
+    # Write some test log entries
+    logger.debug('This is a debug message')
+    logger.info('This is an info message')
+    logger.warning('This is a warning message')
+    logger.error('This is an error message')
+    logger.critical('This is a critical message')
 
-print('Test log entries written. Check the logs directory for the django.log file.')
\ No newline at end of file
+    print('Test log entries written. Check the logs directory for the django.log file.')
+
+if __name__ == '__main__':
+    main()
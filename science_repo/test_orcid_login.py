@@ -1,13 +1,25 @@
 import requests
 import sys
-import json
 from urllib.parse import urljoin
+from django.test import TestCase
 
 # Base URL for the API server
 BASE_URL = "https://v2202209183503201737.happysrv.de/"
 
-def test_orcid_login():
+class OrcidLoginTest(TestCase):
     """Test the ORCID login endpoint"""
+
+    def test_orcid_login(self):
+        """Test that the ORCID login endpoint returns an auth URL carrying the OAuth state"""
+        response = self.client.get('/api/auth/orcid/login/')
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertIn('auth_url', data)
+        self.assertIn(f"state={data['state']}", data['auth_url'])
+
+def check_orcid_login():
+    """Check the ORCID login endpoint of the deployed server"""
     url = urljoin(BASE_URL, "api/auth/orcid/login/")
     print(f"Testing ORCID login at {url}...")
     
@@ -16,11 +28,12 @@ def test_orcid_login():
         print(f"Status code: {response.status_code}")
         
         try:
-            print(f"Response: {json.dumps(response.json(), indent=2)}")
+            print(f"Response: {response.text}")
+            data = response.json()
             
             # Check if the response contains the auth_url field
-            if response.status_code == 200 and 'auth_url' in response.json():
-                auth_url = response.json()['auth_url']
+            if response.status_code == 200 and 'auth_url' in data:
+                auth_url = data['auth_url']
                 print(f"✅ ORCID login endpoint is working!")
                 print(f"Auth URL: {auth_url}")
                 
@@ -36,4 +49,4 @@ def test_orcid_login():
         print(f"❌ Error: {str(e)}")
 
 if __name__ == "__main__":
-    test_orcid_login()
\ No newline at end of file
+    check_orcid_login()
\ No newline at end of file
@@ -1,8 +1,14 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
 import sys
 import time
 from urllib.parse import urlparse, parse_qs
+from django.contrib.auth import get_user_model
+from django.core import mail
+from rest_framework.test import APITestCase
+from rest_framework import status
+
+User = get_user_model()
 
 # Configuration
 API_BASE_URL = "https://v2202209183503201737.happysrv.de/srahmel/living-science-documents/api"
@@ -15,6 +21,53 @@ LOGIN_URL = f"{API_BASE_URL}/auth/login/"
 PASSWORD_RESET_URL = f"{API_BASE_URL}/api/auth/password-reset/"
 PASSWORD_RESET_CONFIRM_URL = f"{API_BASE_URL}/api/auth/password-reset/confirm/"
 
+# One session for the whole walkthrough, so the calls share a TLS connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+class PasswordResetFlowTest(APITestCase):
+    """Test requesting a password reset, confirming it and logging in with the new password"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='resetuser',
+            email=EMAIL,
+            password=PASSWORD
+        )
+
+    def reset_password(self):
+        """Request a reset, take the token from the email and confirm the new password"""
+        response = self.client.post('/api/auth/password-reset/', {'email': EMAIL})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # The reset link in the email carries the token as a query parameter
+        self.assertEqual(len(mail.outbox), 1)
+        reset_link = next(word for word in mail.outbox[0].body.split() if 'token=' in word)
+        token = parse_qs(urlparse(reset_link).query)['token'][0]
+
+        return self.client.post('/api/auth/password-reset/confirm/', {
+            'token': token,
+            'email': EMAIL,
+            'password': NEW_PASSWORD
+        })
+
+    def test_password_reset_flow(self):
+        """Test that the token from the reset email sets a new password"""
+        response = self.reset_password()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.post('/api/auth/login/', {'username': 'resetuser', 'password': NEW_PASSWORD})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.data)
+
+    def test_old_password_rejected_after_reset(self):
+        """Test that the previous password no longer works once the reset is confirmed"""
+        self.reset_password()
+
+        response = self.client.post('/api/auth/login/', {'username': 'resetuser', 'password': PASSWORD})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
 def print_step(message):
     """Print a step message with formatting"""
     print("\n" + "="*80)
@@ -24,12 +77,10 @@ def print_step(message):
 def print_response(response):
     """Print response details"""
     print(f"Status Code: {response.status_code}")
-    try:
-        print(f"Response: {json.dumps(response.json(), indent=2)}")
-    except:
-        print(f"Response: {response.text}")
+    # The body is already JSON; print it as sent rather than re-encoding it
+    print(f"Response: {response.text}")
 
-def test_login(username, password):
+def login(username, password):
     """Test login with given credentials"""
     print_step(f"Testing login with username: {username}, password: {password}")
     
@@ -38,7 +89,7 @@ def test_login(username, password):
         "password": password
     }
     
-    response = requests.post(LOGIN_URL, json=data)
+    response = SESSION.post(LOGIN_URL, json=data)
     print_response(response)
     
     if response.status_code == 200:
@@ -56,7 +107,7 @@ def request_password_reset(email):
         "email": email
     }
     
-    response = requests.post(PASSWORD_RESET_URL, json=data)
+    response = SESSION.post(PASSWORD_RESET_URL, json=data)
     print_response(response)
     
     if response.status_code == 200:
@@ -77,7 +128,7 @@ def reset_password(token, email, new_password):
         "password": new_password
     }
     
-    response = requests.post(PASSWORD_RESET_CONFIRM_URL, json=data)
+    response = SESSION.post(PASSWORD_RESET_CONFIRM_URL, json=data)
     print_response(response)
     
     if response.status_code == 200:
@@ -117,8 +168,13 @@ def main():
     
     # Step 5: Test login with new password
     print_step("TESTING LOGIN WITH NEW PASSWORD")
-    time.sleep(2)  # Small delay to ensure password reset is processed
-    new_access_token = test_login(EMAIL, NEW_PASSWORD)
+    # The new password is saved before the confirm request returns, so the
+    # first attempt normally succeeds; retry briefly in case a replica lags
+    for delay in (0.05, 0.1, 0.2, 0.5):
+        new_access_token = login(EMAIL, NEW_PASSWORD)
+        if new_access_token:
+            break
+        time.sleep(delay)
     
     if new_access_token:
         print("\n" + "="*80)
@@ -1,7 +1,7 @@
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient, APITestCase
+from rest_framework.test import APITestCase
 from rest_framework import status
 from publications.models import Publication
 import json
@@ -11,12 +11,12 @@ User = get_user_model()
 class PublicationCreatorTest(APITestCase):
     """Test that the creator of a publication is properly associated with it"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.publications_url = '/api/publications/publications/'
+    @classmethod
+    def setUpTestData(cls):
+        cls.publications_url = '/api/publications/publications/'
 
         # Create a user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpassword123',
@@ -36,7 +36,7 @@ class PublicationCreatorTest(APITestCase):
             'title': 'Test Publication',
             'short_title': 'Test Pub'
         }
-        response = self.client.post(self.publications_url, publication_data, format='json')
+        response = self.client.post(self.publications_url, publication_data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Get the publication ID
@@ -1,7 +1,7 @@
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient, APITestCase
+from rest_framework.test import APITestCase
 from rest_framework import status
 from publications.models import Publication
 import json
@@ -18,12 +18,12 @@ class PublicationNoVersionsTest(APITestCase):
     using the model, bypassing the API.
     """
 
-    def setUp(self):
-        self.client = APIClient()
-        self.publications_url = '/api/publications/publications/'
+    @classmethod
+    def setUpTestData(cls):
+        cls.publications_url = '/api/publications/publications/'
 
         # Create a user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpassword123',
@@ -32,10 +32,10 @@ class PublicationNoVersionsTest(APITestCase):
         )
 
         # Create a publication with the user as editorial_board
-        self.publication = Publication.objects.create(
+        cls.publication = Publication.objects.create(
             title='Test Publication',
             short_title='Test Pub',
-            editorial_board=self.user
+            editorial_board=cls.user
         )
 
     def test_user_can_view_publication_with_no_versions(self):
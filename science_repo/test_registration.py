@@ -1,26 +1,15 @@
-import requests
-import sys
-import json
-import uuid
-from urllib.parse import urljoin
+from unittest.mock import patch
+from rest_framework.test import APITestCase
+from rest_framework import status
 
-# Base URL for the API server
-BASE_URL = "https://v2202209183503201737.happysrv.de/"
+class RegistrationLoginFlowTest(APITestCase):
+    """Test registering a new user, logging in and using the issued token"""
 
-def test_registration():
-    """Test the registration endpoint"""
-    url = urljoin(BASE_URL, "api/auth/register/")
-    print(f"Testing registration at {url}...")
-    
-    # Generate a unique username to avoid conflicts
-    unique_id = str(uuid.uuid4())[:8]
-    
-    # Create registration data with all required fields
     registration_data = {
-        "username": f"testuser_{unique_id}",
+        "username": "testuser_flow",
         "password": "TestPassword123!",
         "password2": "TestPassword123!",
-        "email": f"test_{unique_id}@example.com",
+        "email": "test_flow@example.com",
         "first_name": "Test",
         "last_name": "User",
         "dsgvo_consent": True,
@@ -28,57 +17,26 @@ def test_registration():
         "research_field": "Computer Science",
         "qualification": "PhD"
     }
-    
-    try:
-        response = requests.post(url, json=registration_data)
-        print(f"Status code: {response.status_code}")
-        
-        try:
-            print(f"Response: {json.dumps(response.json(), indent=2)}")
-        except:
-            print(f"Response text: {response.text[:200]}...")
-        
-        if response.status_code == 201:
-            print("✅ Registration successful!")
-            
-            # Test login with the new user
-            login_url = urljoin(BASE_URL, "api/auth/login/")
-            login_data = {
-                "username": registration_data["username"],
-                "password": registration_data["password"]
-            }
-            
-            print(f"\nTesting login with new user at {login_url}...")
-            login_response = requests.post(login_url, json=login_data)
-            print(f"Status code: {login_response.status_code}")
-            
-            try:
-                print(f"Response: {json.dumps(login_response.json(), indent=2)}")
-                if login_response.status_code == 200:
-                    print("✅ Login successful!")
-                    
-                    # Test accessing a protected endpoint with the token
-                    token = login_response.json().get("access")
-                    if token:
-                        users_url = urljoin(BASE_URL, "api/auth/users/")
-                        headers = {"Authorization": f"Bearer {token}"}
-                        
-                        print(f"\nTesting access to protected endpoint at {users_url}...")
-                        users_response = requests.get(users_url, headers=headers)
-                        print(f"Status code: {users_response.status_code}")
-                        
-                        if users_response.status_code == 200:
-                            print("✅ Access to protected endpoint successful!")
-                        else:
-                            print("❌ Access to protected endpoint failed!")
-                else:
-                    print("❌ Login failed!")
-            except:
-                print(f"Response text: {login_response.text[:200]}...")
-        else:
-            print("❌ Registration failed!")
-    except Exception as e:
-        print(f"❌ Error: {str(e)}")
 
-if __name__ == "__main__":
-    test_registration()
\ No newline at end of file
+    @patch('core.email.EmailService.send_welcome_email', return_value=True)
+    def test_registration(self, _mock_send_welcome_email):
+        """Test that a freshly registered user can log in and reach a protected endpoint"""
+        response = self.client.post('/api/auth/register/', self.registration_data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, msg=response.content)
+
+        login_data = {
+            "username": self.registration_data["username"],
+            "password": self.registration_data["password"]
+        }
+        response = self.client.post('/api/auth/login/', login_data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, msg=response.content)
+
+        token = response.data.get("access")
+        self.assertTrue(token)
+
+        # The user list is admin only; a regular user may read their own record
+        user_id = response.data["user"]["id"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        response = self.client.get(f'/api/auth/users/{user_id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["username"], self.registration_data["username"])
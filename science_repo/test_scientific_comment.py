@@ -2,34 +2,29 @@ from django.test import TestCase
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
-from django.contrib.auth import get_user_model
 from publications.models import Publication, DocumentVersion, Author
 from comments.models import CommentType, Comment
-import json
-
-User = get_user_model()
+from tests.factories import make_user
 
 class ScientificCommentTest(TestCase):
     """Test creating a comment with 'scientific' as the comment_type"""
 
-    def setUp(self):
-        # Create a test user
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpassword'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        # Each row below references the previous one, so they cannot be
+        # bulk created; TestCase already runs all of this in one transaction
+        cls.user = make_user('testuser')
 
         # Create a publication
-        self.publication = Publication.objects.create(
+        cls.publication = Publication.objects.create(
             title='Test Publication',
             status='published',
-            editorial_board=self.user
+            editorial_board=cls.user
         )
 
         # Create a document version
-        self.version = DocumentVersion.objects.create(
-            publication=self.publication,
+        cls.version = DocumentVersion.objects.create(
+            publication=cls.publication,
             version_number=5,
             status='published',
             doi='10.1234/test.2023.001.v1',
@@ -38,37 +33,38 @@ class ScientificCommentTest(TestCase):
 
         # Create an author for the document version
         Author.objects.create(
-            document_version=self.version,
-            user=self.user,
+            document_version=cls.version,
+            user=cls.user,
             name='Test User',
-            email='test@example.com',
+            email=cls.user.email,
             is_corresponding=True
         )
 
         # Create comment types if they don't exist
-        for code, name in [
-            ('SC', 'Scientific Comment'),
-            ('rSC', 'Response to Scientific Comment'),
-            ('ER', 'Error Correction'),
-            ('AD', 'Additional Data'),
-            ('NP', 'New Publication')
-        ]:
-            CommentType.objects.get_or_create(
+        CommentType.objects.bulk_create([
+            CommentType(
                 code=code,
-                defaults={
-                    'name': name,
-                    'description': f'Description for {name}',
-                    'requires_doi': code != 'ER'
-                }
+                name=name,
+                description=f'Description for {name}',
+                requires_doi=code != 'ER'
             )
+            for code, name in [
+                ('SC', 'Scientific Comment'),
+                ('rSC', 'Response to Scientific Comment'),
+                ('ER', 'Error Correction'),
+                ('AD', 'Additional Data'),
+                ('NP', 'New Publication')
+            ]
+        ], ignore_conflicts=True)
+
+        # URL for creating comments
+        cls.comments_url = reverse('comment-list')
 
+    def setUp(self):
         # Set up the API client
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
-        # URL for creating comments
-        self.comments_url = reverse('comment-list')
-
     def test_create_scientific_comment(self):
         """Test creating a comment with 'scientific' as the comment_type"""
         # This is based on the payload from the issue description
@@ -81,7 +77,7 @@ class ScientificCommentTest(TestCase):
             "doi_requested": False
         }
 
-        response = self.client.post(self.comments_url, comment_data, format='json')
+        response = self.client.post(self.comments_url, comment_data)
         print(f"Response status: {response.status_code}")
         print(f"Response content: {response.content.decode()}")
 
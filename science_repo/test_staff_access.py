@@ -1,99 +1,79 @@
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from django.utils import timezone
-from rest_framework.test import APIClient, APITestCase
+from rest_framework.test import APITestCase
 from rest_framework import status
-from publications.models import Publication, DocumentVersion, Author
-import json
+from publications.models import Publication, DocumentVersion
+from tests.factories import build_user, make_draft_version
 
 User = get_user_model()
 
 class StaffAccessTest(APITestCase):
-    """Test that staff members and superusers can view draft documents"""
+    """Test that staff members and superusers can view draft documents
 
-    def setUp(self):
-        self.client = APIClient()
-        self.publications_url = '/api/publications/publications/'
+    Relies on TestCase rolling each test back to a savepoint, which is what
+    lets setUpTestData share rows between tests. Keep it off
+    TransactionTestCase; wrap code that needs on_commit callbacks in
+    self.captureOnCommitCallbacks(execute=True) instead.
+    """
 
-        # Create staff user
-        self.staff_user = User.objects.create_user(
-            username='staff',
-            email='staff@example.com',
-            password='staffpassword123',
-            first_name='Staff',
-            last_name='User',
-            is_staff=True
-        )
-
-        # Create superuser
-        self.superuser = User.objects.create_user(
-            username='superuser',
-            email='superuser@example.com',
-            password='superuserpassword123',
-            first_name='Super',
-            last_name='User',
-            is_staff=True,
-            is_superuser=True
-        )
-
-        # Create regular user
-        self.regular_user = User.objects.create_user(
-            username='regular',
-            email='regular@example.com',
-            password='regularpassword123',
-            first_name='Regular',
-            last_name='User'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        # Staff user, superuser, regular user and another regular user who is
+        # not the editorial board member or author, inserted in one statement
+        cls.staff_user, cls.superuser, cls.regular_user, cls.another_user = User.objects.bulk_create([
+            build_user('staff', first_name='Staff', last_name='User', is_staff=True),
+            build_user('superuser', first_name='Super', last_name='User', is_staff=True, is_superuser=True),
+            build_user('regular', first_name='Regular', last_name='User'),
+            build_user('another'),
+        ])
 
         # Create a publication with editorial_board set to regular_user
-        self.publication = Publication.objects.create(
+        cls.publication = Publication.objects.create(
             title='Test Publication',
             short_title='Test Pub',
-            editorial_board=self.regular_user
-        )
-
-        # Create a draft document version
-        self.draft_version = DocumentVersion.objects.create(
-            publication=self.publication,
-            version_number=1,
-            status='draft',
-            status_date=timezone.now(),
-            status_user=self.regular_user,
-            technical_abstract='Draft abstract',
-            introduction='Draft introduction',
-            methodology='Draft methodology',
-            main_text='Draft main text',
-            conclusion='Draft conclusion',
-            author_contributions='Draft author contributions',
-            references='Draft references',
-            doi='10.1234/test.2023.001.v1'
+            editorial_board=cls.regular_user
         )
+        cls.current_version_url = reverse('publication-current-version', args=[cls.publication.pk])
 
-    def test_staff_can_view_draft(self):
-        """Test that staff members can view draft documents"""
-        self.client.force_authenticate(user=self.staff_user)
-        response = self.client.get(f"{self.publications_url}{self.publication.id}/current_version/")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['status'], 'draft')
+        # Only status and status_user matter here, so the text sections stay empty
+        cls.draft_version = make_draft_version(cls.publication, cls.regular_user)
 
-    def test_superuser_can_view_draft(self):
-        """Test that superusers can view draft documents"""
-        self.client.force_authenticate(user=self.superuser)
-        response = self.client.get(f"{self.publications_url}{self.publication.id}/current_version/")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['status'], 'draft')
+    def test_staff_and_superuser_can_view_draft(self):
+        """Test that staff members and superusers can view draft documents"""
+        for user in (self.staff_user, self.superuser):
+            with self.subTest(user=user.username):
+                self.client.force_authenticate(user=user)
+                # Publication, versions and authors, plus the serializer's nested relations
+                with self.assertNumQueries(8):
+                    response = self.client.get(self.current_version_url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['status'], 'draft')
 
     def test_regular_user_cannot_view_draft(self):
         """Test that regular users cannot view draft documents they don't own"""
-        # Create another regular user who is not the editorial board member or author
-        another_user = User.objects.create_user(
-            username='another',
-            email='another@example.com',
-            password='anotherpassword123'
-        )
-        
-        self.client.force_authenticate(user=another_user)
-        response = self.client.get(f"{self.publications_url}{self.publication.id}/current_version/")
+        self.client.force_authenticate(user=self.another_user)
+        # Publication, versions and authors; the published-version fallback reuses them
+        with self.assertNumQueries(3):
+            response = self.client.get(self.current_version_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertEqual(response.data['error'], 'No published version found.')
\ No newline at end of file
+        self.assertEqual(response.data['error'], 'No published version found.')
+
+    def test_published_version_query_budget(self):
+        """Test that users without draft access get the published version in a fixed number of queries"""
+        published_version = DocumentVersion.objects.create(
+            publication=self.publication,
+            version_number=2,
+            status='published',
+            doi=f'10.1234/test.v2.{self.publication.id}'
+        )
+        # Signed in: publication, versions and authors, which the published
+        # fallback reuses, plus the serializer's other five nested relations.
+        # Anonymous: publication and its published version, plus all six.
+        for user in (self.another_user, None):
+            with self.subTest(user=user and user.username):
+                self.client.force_authenticate(user=user)
+                with self.assertNumQueries(8):
+                    response = self.client.get(self.current_version_url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['id'], published_version.id)
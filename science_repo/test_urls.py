@@ -1,21 +1,11 @@
+from django.test import SimpleTestCase
 from django.urls import reverse
 
-def test_reverse():
-    try:
-        url = reverse('register')
-        print(f"URL for 'register': {url}")
-    except Exception as e:
-        print(f"Error resolving 'register': {e}")
+class UrlReverseTest(SimpleTestCase):
+    """Test that the auth URL names resolve to their API paths"""
 
-    try:
-        url = reverse('login')
-        print(f"URL for 'login': {url}")
-    except Exception as e:
-        print(f"Error resolving 'login': {e}")
+    def test_register(self):
+        self.assertEqual(reverse('register'), '/api/auth/register/')
 
-if __name__ == "__main__":
-    import os
-    import django
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "science_repo.settings")
-    django.setup()
-    test_reverse()
+    def test_login(self):
+        self.assertEqual(reverse('login'), '/api/auth/login/')
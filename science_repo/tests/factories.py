@@ -0,0 +1,50 @@
+"""
+Small helpers for building test fixtures.
+
+Meant to be called from ``setUpTestData`` so rows are created once per
+TestCase class instead of once per test method.
+"""
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from publications.models import DocumentVersion
+
+User = get_user_model()
+
+
+def make_user(username, **extra):
+    """Create a user with a predictable email address and an unusable password.
+
+    No password hasher runs; tests authenticate these users with
+    ``force_authenticate``/``force_login`` rather than a password.
+    """
+    return User.objects.create_user(
+        username=username,
+        email=f'{username}@example.com',
+        password=None,
+        **extra
+    )
+
+
+def build_user(username, **extra):
+    """Return an unsaved user like the ones make_user() creates, for bulk_create()"""
+    user = User(username=username, email=f'{username}@example.com', **extra)
+    user.set_unusable_password()
+    return user
+
+
+def make_draft_version(publication, user):
+    """Create a first draft version of ``publication`` with ``user`` as status user.
+
+    Only the fields the access checks look at are set; the text sections are
+    left empty.
+    """
+    return DocumentVersion.objects.create(
+        publication=publication,
+        version_number=1,
+        status='draft',
+        status_date=timezone.now(),
+        status_user=user,
+        doi=f'10.1234/test.v1.{publication.id}'
+    )
@@ -0,0 +1,138 @@
+import re
+import urllib.parse
+from django.test import TestCase, override_settings
+from unittest.mock import patch, DEFAULT
+
+# Pull the redirect_uri out of the auth URL without parsing the whole query string
+_REDIRECT_URI_RE = re.compile(r'[?&]redirect_uri=([^&]+)')
+
+
+class AuthRouteTestCase(TestCase):
+    # Settings overridden once for the whole class, before any fixtures are set up
+    settings_override = {}
+
+    @classmethod
+    def setUpClass(cls):
+        if cls.settings_override:
+            cls.enterClassContext(override_settings(**cls.settings_override))
+        super().setUpClass()
+
+    def parse_redirect(self, resp):
+        """Assert that resp is a redirect and return its parsed Location and query parameters"""
+        self.assertEqual(resp.status_code, 302)
+        parsed = urllib.parse.urlparse(resp['Location'])
+        return parsed, urllib.parse.parse_qs(parsed.query)
+
+
+class OrcidStubMixin:
+    """Stub out the ORCID API once for the whole class rather than per test"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.orcid_mocks = cls.enterClassContext(patch.multiple(
+            'core.orcid.ORCIDAuth',
+            extract_user_info=DEFAULT,
+            get_orcid_profile=DEFAULT,
+            validate_orcid_checksum=DEFAULT,
+            get_token=DEFAULT,
+        ))
+        cls.orcid_mocks['extract_user_info'].return_value = {
+            'first_name': 'A', 'last_name': 'B', 'email': '', 'other_names': [],
+            'biography': '', 'keywords': [], 'country': '', 'website': ''
+        }
+        cls.orcid_mocks['get_orcid_profile'].return_value = {}
+        cls.orcid_mocks['validate_orcid_checksum'].return_value = True
+        cls.orcid_mocks['get_token'].return_value = {'orcid': '0000-0001-2345-6789', 'access_token': 'tok'}
+
+    def setUp(self):
+        super().setUp()
+        # Keep call assertions limited to the current test
+        for mock in self.orcid_mocks.values():
+            mock.reset_mock()
+
+    def seed_oauth_state(self, state='state123'):
+        session = self.client.session
+        session['orcid_oauth_state'] = state
+        session.save()
+
+
+class LoginSuccessRouteTest(AuthRouteTestCase):
+    def test_login_success_routes(self):
+        for url in ('/login/success', '/login/success/', '/api/auth/login/success/'):
+            with self.subTest(url=url):
+                resp = self.client.get(url)
+                self.assertEqual(resp.status_code, 200)
+                self.assertIn(b'Login Success', resp.content)
+
+
+class OrcidPrefixedPathsTest(OrcidStubMixin, AuthRouteTestCase):
+    settings_override = {'FORCE_SCRIPT_NAME': '/prefix'}
+
+    def test_orcid_login_redirect_uri_contains_prefix(self):
+        resp = self.client.get('/api/auth/orcid/login/')
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertIn('auth_url', data)
+        match = _REDIRECT_URI_RE.search(data['auth_url'])
+        self.assertIsNotNone(match)
+        self.assertIn('/prefix/api/auth/orcid/callback/', urllib.parse.unquote(match.group(1)))
+
+    def test_orcid_callback_redirects_to_prefixed_login_success(self):
+        self.seed_oauth_state()
+        resp = self.client.get('/api/auth/orcid/callback/?code=abc&state=state123')
+        parsed, query = self.parse_redirect(resp)
+        self.assertEqual(parsed.netloc, 'testserver')
+        # Accept either API-scoped success route (preferred) or root-level route
+        self.assertTrue(parsed.path.startswith(('/prefix/api/auth/login/success', '/prefix/login/success')))
+        # Ensure tokens are passed as query params
+        self.assertIn('access', query)
+        self.assertIn('refresh', query)
+
+
+class OrcidRedirectOverrideTest(OrcidStubMixin, AuthRouteTestCase):
+    settings_override = {'ORCID_REDIRECT_URI': 'https://override.example.org/sso/orcid/callback'}
+
+    def test_login_uses_override_redirect_uri_verbatim(self):
+        resp = self.client.get('/api/auth/orcid/login/')
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertIn('auth_url', data)
+        match = _REDIRECT_URI_RE.search(data['auth_url'])
+        self.assertIsNotNone(match)
+        # Exact match, no extra params added
+        self.assertEqual(urllib.parse.unquote(match.group(1)), 'https://override.example.org/sso/orcid/callback')
+
+    def test_callback_calls_get_token_with_override(self):
+        # Verify get_token called with overridden redirect_uri
+        self.seed_oauth_state()
+        resp = self.client.get('/api/auth/orcid/callback/?code=abc&state=state123')
+        self.assertEqual(resp.status_code, 302)
+        # Assert call args include override
+        args, kwargs = self.orcid_mocks['get_token'].call_args
+        self.assertEqual(args[0], 'abc')
+        self.assertEqual(args[1], 'https://override.example.org/sso/orcid/callback')
+
+
+class OrcidStartTest(AuthRouteTestCase):
+    def test_orcid_start_redirects(self):
+        resp = self.client.get('/api/auth/orcid/start/')
+        # Should redirect to ORCID authorize endpoint
+        parsed, query = self.parse_redirect(resp)
+        self.assertIn('oauth/authorize', parsed.path)
+        # Has redirect_uri param
+        self.assertIn('redirect_uri', query)
+        # Has state param
+        self.assertIn('state', query)
+
+
+class OrcidStartPrefixedTest(AuthRouteTestCase):
+    settings_override = {'FORCE_SCRIPT_NAME': '/prefix'}
+
+    def test_orcid_start_redirect_uri_contains_prefix(self):
+        resp = self.client.get('/api/auth/orcid/start/')
+        self.assertEqual(resp.status_code, 302)
+        # Only redirect_uri is checked, so skip parsing the rest of the query
+        match = _REDIRECT_URI_RE.search(resp['Location'])
+        self.assertIsNotNone(match)
+        self.assertIn('/prefix/api/auth/orcid/callback/', urllib.parse.unquote(match.group(1)))